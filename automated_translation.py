@@ -5,13 +5,105 @@ Test script for automated translation logic
 
 import os
 import sys
+import copy
+import functools
 import json
 import xml.etree.ElementTree as ET
 import shutil
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from translations_applicator import load_language_bundle, process_single_file
 
-def apply_translations_automated(lang_code, mod_version):
+_MOD_VERSION_RE = re.compile(r'^(\d+)\.(\d+)\.(\d+)(a?)$')
+_COPY_BUFSIZE = 1024 * 1024
+
+def _copy_file_range(fsrc, fdst):
+    """
+    Copy an open file in-kernel with os.copy_file_range (a reflink on CoW filesystems).
+    
+    Returns:
+        bool: False if copy_file_range is unavailable or refused before any byte was copied
+    """
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    if copy_file_range is None:
+        return False
+    
+    infd, outfd = fsrc.fileno(), fdst.fileno()
+    size = os.fstat(infd).st_size
+    count = max(size, _COPY_BUFSIZE)
+    copied = 0
+    while True:
+        try:
+            sent = copy_file_range(infd, outfd, count)
+        except OSError:
+            if copied:
+                raise
+            return False
+        if sent == 0:
+            # Some filesystems (FUSE, overlays, virtual files) report 0 instead
+            # of an error when they don't support it: fall back if nothing of
+            # a non-empty source was copied
+            return copied > 0 or size == 0
+        copied += sent
+
+def _copy_file(src, dst):
+    """
+    Copies a file with its metadata, like shutil.copy2.
+    
+    Uses os.copy_file_range when available and otherwise a 1 MiB buffered
+    copy instead of the default 64 KiB one.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        if not _copy_file_range(fsrc, fdst):
+            shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+    shutil.copystat(src, dst)
+
+def _fast_copy(src, dst):
+    """
+    Places src at dst as cheaply as possible, for files copied without translation.
+    
+    Tries a hard link first (no data is copied at all, and the metadata is the
+    source's own) and falls back to _copy_file when linking is not possible,
+    e.g. across devices or on filesystems without hard links. A linked dst
+    shares its data with src, so it must be replaced rather than edited in place.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        _copy_file(src, dst)
+
+@functools.lru_cache(maxsize=8)
+def _parse_info_xml(info_xml_path, mtime_ns):
+    """
+    Parses info.xml, comments included, once per file version.
+    
+    The bytes are read in one call and handed to the C-backed stdlib parser.
+    The mtime is part of the cache key, so an edited file is parsed again when
+    the automated run is repeated in the same process (e.g. for several
+    languages). The returned root is shared: deepcopy it before changing it.
+    """
+    with open(info_xml_path, 'rb') as f:
+        info_data = f.read()
+    return ET.fromstring(info_data, parser=ET.XMLParser(target=ET.TreeBuilder(insert_comments=True)))
+
+def _write_bytes(path, data):
+    """Writes already encoded data to path with raw os calls, skipping the text I/O stack."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _write_log(lines):
+    """Writes the buffered diagnostic lines to stdout in a single call and empties the buffer."""
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+        lines.clear()
+
+def apply_translations_automated(lang_code: str, mod_version: str) -> bool:
     """
     Automated version of apply_translations with pre-configured choices.
     
@@ -38,41 +130,58 @@ def apply_translations_automated(lang_code, mod_version):
     output_dir = f"output/{lang_code.upper()}"
     special_cases_file = f"translations/pokeapi/{lang_code}/special_cases-{lang_code}.json"
     
-    # Check paths
-    if not os.path.exists(input_dir):
-        print(f"Error: Input folder '{input_dir}' not found")
+    # Check paths by looking up info.xml directly; the folders are only
+    # inspected to report which one is missing
+    try:
+        info_xml_mtime_ns = os.stat(info_xml_path).st_mtime_ns
+    except FileNotFoundError:
+        if not os.path.isdir(input_dir):
+            print(f"Error: Input folder '{input_dir}' not found")
+        else:
+            print(f"Error: info.xml not found in '{input_dir}'")
         return False
-        
-    if not os.path.exists(info_xml_path):
-        print(f"Error: info.xml not found in '{input_dir}'")
+    except OSError as e:
+        print(f"Error reading info.xml: {e}")
         return False
     
     print(f"Input directory found: {input_dir}")
     print(f"Info.xml found: {info_xml_path}")
     
-    # Parse info.xml
+    # Parse info.xml (cached per file version) and work on a private copy of
+    # the tree, which is updated and written back as the output info.xml
     input_files = []
     original_version = ""
+    log = []  # Per-file diagnostics, written once per phase; errors are printed right away
+    existing_names = {}  # Input subdirectory -> names it contains, listed once with scandir
     try:
-        tree = ET.parse(info_xml_path)
-        root = tree.getroot()
+        root = copy.deepcopy(_parse_info_xml(info_xml_path, info_xml_mtime_ns))
         
         original_version = root.get('version', '')
-        print(f"Original version detected: {original_version}")
+        log.append(f"Original version detected: {original_version}")
         
         for string_element in root.find('strings').findall('string'):
             relative_path = string_element.get('path')
             if relative_path:
                 absolute_path = os.path.join(input_dir, relative_path)
-                if os.path.exists(absolute_path):
+                parent_dir, name = os.path.split(absolute_path)
+                if parent_dir not in existing_names:
+                    try:
+                        with os.scandir(parent_dir) as entries:
+                            existing_names[parent_dir] = {entry.name for entry in entries}
+                    except OSError:
+                        existing_names[parent_dir] = set()
+                # Names differing only in case still exist on case-insensitive file systems
+                if name in existing_names[parent_dir] or os.path.exists(absolute_path):
                     input_files.append(absolute_path)
-                    print(f"  Found file: {relative_path}")
+                    log.append(f"  Found file: {relative_path}")
                 else:
-                    print(f"  File not found: {relative_path}")
+                    log.append(f"  File not found: {relative_path}")
         
-        print(f"Extracted {len(input_files)} files from info.xml")
+        log.append(f"Extracted {len(input_files)} files from info.xml")
+        _write_log(log)
         
     except Exception as e:
+        _write_log(log)
         print(f"Error parsing info.xml: {e}")
         return False
     
@@ -81,9 +190,11 @@ def apply_translations_automated(lang_code, mod_version):
         return False
     
     # Clean up old output directory
-    if os.path.exists(output_dir):
+    try:
         shutil.rmtree(output_dir)
         print(f"Removed old output directory: {output_dir}")
+    except FileNotFoundError:
+        pass
     
     Path(output_dir).mkdir(parents=True, exist_ok=True)
     print(f"Created output directory: {output_dir}")
@@ -91,42 +202,13 @@ def apply_translations_automated(lang_code, mod_version):
     # Copy and update info.xml
     output_info_path = os.path.join(output_dir, "info.xml")
     try:
-        with open(info_xml_path, 'r', encoding='utf-8') as f:
-            info_content = f.read()
-        
-        # Update XML attributes
-        updated_content = info_content
-        
-        # Update name attribute: add " ITA(ClientENG)"
-        updated_content = re.sub(
-            r'(<resource\s+name="[^"]*)"',
-            r'\1 ITA(ClientENG)"',
-            updated_content
-        )
+        # Update the attributes of the already parsed <resource> root
+        root.set('name', root.get('name', '') + " ITA(ClientENG)")
+        root.set('version', root.get('version', '') + f"-mod_{mod_version}")
+        root.set('author', root.get('author', '') + " (edited by FlaProGmr)")
+        root.set('description', root.get('description', '') + " (edited version from: https://github.com/F-l-a/Poke-translator/releases)")
         
-        # Update version attribute: add "-mod_{mod_version}"
-        updated_content = re.sub(
-            r'(<resource\s+[^>]*version=")([^"]*)"',
-            rf'\1\2-mod_{mod_version}"',
-            updated_content
-        )
-        
-        # Update author attribute: add " (edited by FlaProGmr)"
-        updated_content = re.sub(
-            r'(<resource\s+[^>]*author=")([^"]*)"',
-            r'\1\2 (edited by FlaProGmr)"',
-            updated_content
-        )
-        
-        # Update description attribute: add edited version info
-        updated_content = re.sub(
-            r'(<resource\s+[^>]*description=")([^"]*)"',
-            r'\1\2 (edited version from: https://github.com/F-l-a/Poke-translator/releases)"',
-            updated_content
-        )
-        
-        with open(output_info_path, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+        _write_bytes(output_info_path, ET.tostring(root, encoding='utf-8', xml_declaration=True))
         
         print(f"Updated info.xml saved to: {output_info_path}")
         
@@ -136,22 +218,43 @@ def apply_translations_automated(lang_code, mod_version):
     
     # Copy icon.png
     icon_input_path = os.path.join(input_dir, "icon.png")
-    if os.path.exists(icon_input_path):
-        icon_output_path = os.path.join(output_dir, "icon.png")
-        shutil.copy2(icon_input_path, icon_output_path)
+    icon_output_path = os.path.join(output_dir, "icon.png")
+    try:
+        _copy_file(icon_input_path, icon_output_path)
         print(f"Copied icon.png to: {icon_output_path}")
-    else:
+    except FileNotFoundError:
         print(f"Warning: icon.png not found in {input_dir}")
     
     # Process files with automated choices
     processed_files = []
+    total_files = len(input_files)
     
-    print(f"\nProcessing {len(input_files)} files with automated choices...")
+    print(f"\nProcessing {total_files} files with automated choices...")
     
-    for i, input_file in enumerate(input_files, 1):
+    # Resolve the relative/output paths of every file once
+    plan = []
+    for input_file in input_files:
         relative_path = os.path.relpath(input_file, input_dir)
-        filename = os.path.basename(relative_path)
-        
+        output_file_path = os.path.join(output_dir, relative_path)
+        plan.append((
+            input_file,
+            relative_path,
+            output_file_path,
+            os.path.dirname(output_file_path),
+            os.path.basename(relative_path)
+        ))
+    
+    # Create every output subdirectory once instead of once per file
+    for output_file_dir in {entry[3] for entry in plan}:
+        if output_file_dir:
+            Path(output_file_dir).mkdir(parents=True, exist_ok=True)
+    
+    # Precompute the constant parts of the "[NN/total]" progress prefix
+    index_width = max(2, len(str(total_files)))
+    progress_suffix = f"/{total_files}]"
+    
+    tasks = []
+    for i, (input_file, relative_path, output_file_path, _, filename) in enumerate(plan, 1):
         # Automated choice logic
         if filename == "sws_strings_en.xml":
             choice = "Y"  # Translate sws_strings_en.xml
@@ -160,52 +263,55 @@ def apply_translations_automated(lang_code, mod_version):
             choice = "N"  # Copy without translation for all others
             action = "COPY ONLY"
         
-        print(f"  [{i:02d}/{len(input_files)}] {relative_path} - {action}")
-        
-        # Create output path
-        output_file_path = os.path.join(output_dir, relative_path)
-        output_file_dir = os.path.dirname(output_file_path)
-        
-        if output_file_dir:
-            Path(output_file_dir).mkdir(parents=True, exist_ok=True)
-        
+        log.append(f"  [{i:0{index_width}d}{progress_suffix} {relative_path} - {action}")
+        tasks.append((i, input_file, relative_path, output_file_path, filename, choice))
+    _write_log(log)
+    
+    # Load the language files once, before the workers share them
+    bundle = None
+    if any(task[5] == "Y" for task in tasks):
+        bundle = load_language_bundle(lang_code, translations_dir, special_cases_file)
+    
+    def process_one(task):
+        """Copies or translates one planned file and returns its log line."""
+        i, input_file, relative_path, output_file_path, filename, choice = task
         if choice == "N":
             # Copy file without translation
+            _fast_copy(input_file, output_file_path)
+            return f"    Copied: {filename}"
+        
+        # Translate the file
+        process_single_file(
+            input_file, 
+            bundle, 
+            output_file_path, 
+            i, 
+            total_files
+        )
+        return f"    Translated: {filename}"
+    
+    # Files are independent of each other: copy/translate them concurrently,
+    # then report the results in info.xml order and stop at the first failure
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(process_one, task) for task in tasks]
+        for task, future in zip(tasks, futures):
+            relative_path, choice = task[2], task[5]
             try:
-                shutil.copy2(input_file, output_file_path)
-                print(f"    Copied: {os.path.basename(output_file_path)}")
-                processed_files.append(relative_path)
-            except Exception as e:
-                print(f"    Error copying: {e}")
-                return False
-        else:
-            # Translate the file
-            try:
-                # Import here to avoid circular imports
-                from translations_applicator import process_single_file
-                
-                process_single_file(
-                    input_file, 
-                    lang_code, 
-                    translations_dir, 
-                    output_file_path, 
-                    special_cases_file, 
-                    i, 
-                    len(input_files)
-                )
-                print(f"    Translated: {os.path.basename(output_file_path)}")
+                log.append(future.result())
                 processed_files.append(relative_path)
             except Exception as e:
-                print(f"    Error translating: {e}")
+                _write_log(log)
+                print(f"    Error {'copying' if choice == 'N' else 'translating'}: {e}")
+                executor.shutdown(wait=False, cancel_futures=True)
                 return False
+    _write_log(log)
     
     # Create zip_name.txt
     try:
         zip_name_content = f"SupersStoryStrings_{lang_code.upper()}-EN_@ClientEN@-@{original_version}-mod_{mod_version}@"
         zip_name_path = os.path.join(output_dir, "zip_name.txt")
         
-        with open(zip_name_path, 'w', encoding='utf-8') as f:
-            f.write(zip_name_content)
+        _write_bytes(zip_name_path, zip_name_content.encode('utf-8'))
         
         print(f"Created zip name file: {zip_name_path}")
         print(f"Zip name: {zip_name_content}")
@@ -215,10 +321,22 @@ def apply_translations_automated(lang_code, mod_version):
         return False
     
     print(f"\nAutomated translation completed successfully!")
-    print(f"Files processed: {len(processed_files)}/{len(input_files)}")
+    print(f"Files processed: {len(processed_files)}/{total_files}")
     return True
 
-def calculate_next_mod_version(submodule_tag, current_repo_tags):
+def _mod_version_key(version_part):
+    """
+    Sort key for the version part of a '<submodule>-mod_<version>' tag.
+    
+    Compares the numeric major/minor/patch parts so that 1.0.10a sorts
+    after 1.0.9a; versions that don't parse sort first. The raw version
+    is the last item of the key, so max() hands it back directly.
+    """
+    match = _MOD_VERSION_RE.match(version_part)
+    numbers = tuple(int(n) for n in match.groups()[:3]) if match else ()
+    return (numbers, version_part)
+
+def calculate_next_mod_version(submodule_tag: str, current_repo_tags: list) -> str:
     """
     Calculate the next mod version based on existing tags.
     
@@ -233,23 +351,26 @@ def calculate_next_mod_version(submodule_tag, current_repo_tags):
     Returns:
         str: Next mod version (e.g., 'v1.4.0-mod_1.0.0a')
     """
-    # Find existing mod tags for this specific submodule version
-    mod_tags = [tag for tag in current_repo_tags if tag.startswith(f"{submodule_tag}-mod_")]
+    # Find existing mod tags for this specific submodule version and key them
+    # by their version part (e.g., "1.0.0a" from "v1.3.4-mod_1.0.0a") in one pass
+    prefix = f"{submodule_tag}-mod_"
+    prefix_len = len(prefix)
+    latest = max(
+        (_mod_version_key(tag[prefix_len:]) for tag in current_repo_tags if tag.startswith(prefix)),
+        default=None
+    )
     
-    if not mod_tags:
+    if latest is None:
         # First mod version for this submodule tag - always start with 1.0.0a
         return f"{submodule_tag}-mod_1.0.0a"
     
     # If there are existing mod tags for this submodule version, increment patch
     # (this should be rare, but handles edge cases)
-    latest_tag = sorted(mod_tags, key=lambda x: x.split('-mod_')[1])[-1]
-    
-    # Extract version part (e.g., "1.0.0a" from "v1.3.4-mod_1.0.0a")
-    version_part = latest_tag.split('-mod_')[1]
+    version_part = latest[1]
     
     # Parse version
-    if re.match(r'^(\d+)\.(\d+)\.(\d+)(a?)$', version_part):
-        match = re.match(r'^(\d+)\.(\d+)\.(\d+)(a?)$', version_part)
+    match = _MOD_VERSION_RE.match(version_part)
+    if match:
         major, minor, patch, auto_suffix = match.groups()
         
         # Increment patch version for additional release of same submodule version
@@ -265,49 +386,44 @@ def test_version_calculation():
     """Test the version calculation logic"""
     print("Testing version calculation logic...\n")
     
-    test_cases = [
-        {
-            "submodule": "v1.3.4",
-            "existing_tags": [],
-            "expected": "v1.3.4-mod_1.0.0a",
-            "description": "First release for v1.3.4"
-        },
-        {
-            "submodule": "v1.4.0", 
-            "existing_tags": ["v1.3.4-mod_1.0.0a"],
-            "expected": "v1.4.0-mod_1.0.0a",
-            "description": "First release for v1.4.0 (different submodule)"
-        },
-        {
-            "submodule": "v1.3.4",
-            "existing_tags": ["v1.3.4-mod_1.0.0a"],
-            "expected": "v1.3.4-mod_1.0.1a",
-            "description": "Second release for same submodule version (rare case)"
-        },
-        {
-            "submodule": "v1.4.0",
-            "existing_tags": ["v1.3.4-mod_1.0.0a", "v1.4.0-mod_1.0.0a"],
-            "expected": "v1.4.0-mod_1.0.1a",
-            "description": "Additional release for v1.4.0"
-        },
-        {
-            "submodule": "v2.0.0",
-            "existing_tags": ["v1.3.4-mod_1.0.0a", "v1.4.0-mod_1.0.0a", "v1.4.0-mod_1.0.1a"],
-            "expected": "v2.0.0-mod_1.0.0a",
-            "description": "First release for v2.0.0 (brand new submodule version)"
-        }
-    ]
-    
-    for i, test in enumerate(test_cases, 1):
-        result = calculate_next_mod_version(test["submodule"], test["existing_tags"])
-        status = "OK" if result == test["expected"] else "ERR"
-        
-        print(f"Test {i}: {status} - {test['description']}")
-        print(f"  Submodule: {test['submodule']}")
-        print(f"  Existing: {test['existing_tags']}")
-        print(f"  Expected: {test['expected']}")
-        print(f"  Got:      {result}")
-        print()
+    # One tuple per field, aligned by index (case i is SUBMODULES[i], EXISTING[i], ...)
+    SUBMODULES = ("v1.3.4", "v1.4.0", "v1.3.4", "v1.4.0", "v2.0.0", "v2.0.0")
+    EXISTING = (
+        [],
+        ["v1.3.4-mod_1.0.0a"],
+        ["v1.3.4-mod_1.0.0a"],
+        ["v1.3.4-mod_1.0.0a", "v1.4.0-mod_1.0.0a"],
+        ["v1.3.4-mod_1.0.0a", "v1.4.0-mod_1.0.0a", "v1.4.0-mod_1.0.1a"],
+        ["v2.0.0-mod_1.0.9a", "v2.0.0-mod_1.0.10a"],
+    )
+    EXPECTED = (
+        "v1.3.4-mod_1.0.0a",
+        "v1.4.0-mod_1.0.0a",
+        "v1.3.4-mod_1.0.1a",
+        "v1.4.0-mod_1.0.1a",
+        "v2.0.0-mod_1.0.0a",
+        "v2.0.0-mod_1.0.11a",
+    )
+    DESCRIPTIONS = (
+        "First release for v1.3.4",
+        "First release for v1.4.0 (different submodule)",
+        "Second release for same submodule version (rare case)",
+        "Additional release for v1.4.0",
+        "First release for v2.0.0 (brand new submodule version)",
+        "Patch numbers compared numerically (1.0.10a > 1.0.9a)",
+    )
+    
+    results = list(map(calculate_next_mod_version, SUBMODULES, EXISTING))
+    sys.stdout.write("".join(
+        f"Test {i}: {'OK' if result == expected else 'ERR'} - {description}\n"
+        f"  Submodule: {submodule}\n"
+        f"  Existing: {existing}\n"
+        f"  Expected: {expected}\n"
+        f"  Got:      {result}\n"
+        "\n"
+        for i, (submodule, existing, expected, description, result)
+        in enumerate(zip(SUBMODULES, EXISTING, EXPECTED, DESCRIPTIONS, results), 1)
+    ))
 
 if __name__ == "__main__":
     import argparse
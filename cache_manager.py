@@ -1,5 +1,6 @@
 import shelve
 import os
+import sys
 from pokebase import cache
 from utils import print_menu, get_user_choice
 
@@ -17,15 +18,22 @@ def display_cache():
     return
 
   try:
-    with shelve.open(cache.API_CACHE) as db:
-      keys = list(db.keys())
+    # Read-only: no write lock and nothing to sync back on close
+    with shelve.open(cache.API_CACHE, flag='r') as db:
+      # Build the listing while iterating the keys and write it in one go;
+      # the keys are kept to resolve the selected index afterwards
+      keys = []
+      lines = []
+      for i, key in enumerate(db, 1):
+        keys.append(key)
+        lines.append(f"{i}. {key}")
+
       if not keys:
         print("Cache is empty.")
         return
 
       print("Keys found in cache:\n")
-      for i, key in enumerate(keys, 1):
-        print(f"{i}. {key}")
+      sys.stdout.write("\n".join(lines) + "\n")
 
       print("\n0. Back to menu")
       choice = input("\nIf you want to see the content of a key, enter the corresponding number: ")
@@ -1,9 +1,166 @@
 import os
+import sys
 import json
 import re
+import shutil
+import bisect
+import functools
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from utils import print_menu, get_user_choice
 
+# orjson parses the translation files noticeably faster when it is installed
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
+def _load_json(path):
+  """Loads a UTF-8 JSON file, with orjson when available."""
+  if orjson is not None:
+    with open(path, 'rb') as f:
+      return orjson.loads(f.read())
+  with open(path, 'r', encoding='utf-8') as f:
+    return json.load(f)
+
+# <string id="...">text</string> elements of the strings XML files
+_STRING_RE = re.compile(r'(<string\s+id="([^"]+)"[^>]*>)(.*?)(</string>)', re.DOTALL)
+
+# Buffer size used to write the translated XML files
+_WRITE_BUFSIZE = 1024 * 1024
+
+# Number of per-element log lines buffered before they are written out
+_LOG_FLUSH_LINES = 1024
+
+# Content of a parenthesized group, e.g. the type in "Plate (Fire)"
+_PAREN_RE = re.compile(r'\(([^)]+)\)')
+
+# Word tokens used to index the terms; every word token of a term is also a
+# whole word token of any text its pattern matches
+_WORD_RE = re.compile(r'\w+')
+
+# Characters that IGNORECASE matches against ASCII letters although lower()
+# maps them elsewhere, so lowered tokens can't be trusted around them
+_CASE_FOLD_EXTRAS = frozenset('ıſİ')
+
+# Marks the texts missing from a memo, whose values may be None
+_MISSING = object()
+
+def _build_term_index(sorted_terms):
+  """
+  Index the terms by one of their lowered word tokens, so that the terms that
+  can match a text are found from the text's own tokens in a single pass
+  instead of searching every pattern.
+
+  Args:
+    sorted_terms (list): Terms in the order their patterns are applied
+
+  Returns:
+    tuple: (dict mapping a token to the indices of the terms using it,
+            list of indices of the terms that must always be searched)
+  """
+  token_index = {}
+  always_check = []
+  for index, term in enumerate(sorted_terms):
+    lowered = term.lower()
+    tokens = _WORD_RE.findall(lowered)
+    if not tokens or len(lowered) != len(term) or _CASE_FOLD_EXTRAS.intersection(term):
+      always_check.append(index)
+      continue
+    # The longest token is usually the most selective one
+    token_index.setdefault(max(tokens, key=len), []).append(index)
+  return token_index, always_check
+
+@functools.lru_cache(maxsize=None)
+def _term_pattern(english_term):
+  """
+  Compiles the word-bounded, case-insensitive pattern of a term.
+  
+  The token index only hands a few candidate terms to each string, so the
+  patterns are compiled the first time a term is a candidate instead of all
+  upfront when the language is loaded.
+  """
+  # Intelligent word boundary handling for terms with punctuation
+  escaped_term = re.escape(english_term)
+  
+  # If the term ends with punctuation, don't use word boundary at the end
+  if english_term[-1] in '.!?,:;':
+    return re.compile(r'\b' + escaped_term, re.IGNORECASE)
+  # If the term starts with punctuation, don't use word boundary at the beginning  
+  elif english_term[0] in '.!?,:;':
+    return re.compile(escaped_term + r'\b', re.IGNORECASE)
+  # Normal term with full word boundary
+  else:
+    return re.compile(r'\b' + escaped_term + r'\b', re.IGNORECASE)
+
+def _candidate_term_indices(text, term_index, total_terms, after=-1):
+  """
+  Get, in application order, the indices of the terms whose pattern may match the text.
+
+  Args:
+    text (str): Text to translate
+    term_index (tuple): Index returned by _build_term_index
+    total_terms (int): Number of indexed terms
+    after (int): Only return indices greater than this one
+
+  Returns:
+    list: Sorted candidate term indices
+  """
+  token_index, always_check = term_index
+  if _CASE_FOLD_EXTRAS.intersection(text):
+    return list(range(after + 1, total_terms))
+  candidates = set(always_check)
+  for token in set(_WORD_RE.findall(text.lower())):
+    indices = token_index.get(token)
+    if indices:
+      candidates.update(indices)
+  return sorted(index for index in candidates if index > after)
+
+# Context indicators of get_contextual_translation, matched as plain substrings
+# of the lowercased text: each list is one alternation without word
+# boundaries (e.g. 'hi ' also matches inside "this "), searched in a single pass
+_DESCRIPTION_RE = re.compile('|'.join(map(re.escape, (
+  'hello', 'hi ', 'thank you', 'would you like', 'do you want', 
+  'i am', 'i can', 'it is', 'the user', 'the target', 'this move',
+  'you have', 'sorry', 'congratulations', 'welcome'
+))))
+_TYPE_RE = re.compile('|'.join(map(re.escape, (
+  'incense', 'plate', 'berry', 'gem', 'type', 'resistance', 'weakness',
+  'power', 'boost', 'stone', 'charm'
+))))
+_MOVE_RE = re.compile('|'.join(map(re.escape, ('learns', 'teach', 'tutor', 'tm', 'level up', 'move', 'attack', 'skill'))))
+_ABILITY_RE = re.compile('|'.join(map(re.escape, ('ability', 'abilities', 'hidden', 'effect', 'activates'))))
+
+@functools.lru_cache(maxsize=4096)
+def _classify_context(context_text):
+  """
+  Analyzes a context text once for all the terms translated in it.
+  
+  Returns:
+    tuple: (is_description, has_type_indicator, has_move_indicator,
+            has_ability_indicator, is_short_text)
+  """
+  context_lower = context_text.lower()
+  # If text is very long (>50 chars) or contains complete sentences, 
+  # it's probably a description/dialogue → don't translate technical terms like "Psychic"
+  is_description = len(context_text) > 50 or _DESCRIPTION_RE.search(context_lower) is not None
+  return (
+    is_description,
+    _TYPE_RE.search(context_lower) is not None,
+    _MOVE_RE.search(context_lower) is not None,
+    _ABILITY_RE.search(context_lower) is not None,
+    len(context_text.split()) <= 3
+  )
+
+def _flush_log(lines):
+  """Writes the buffered log lines with a single write and empties the buffer."""
+  if lines:
+    lines.append('')
+    sys.stdout.write('\n'.join(lines))
+    lines.clear()
+
 def get_available_translation_languages(base_path: str):
   """
   Returns a list of available languages based on /translations folders
@@ -19,21 +176,22 @@ def get_available_translation_languages(base_path: str):
   languages = []
   
   if os.path.exists(translations_dir):
-    for item in os.listdir(translations_dir):
-      item_path = os.path.join(translations_dir, item)
-      if os.path.isdir(item_path):
-        # Check if folder contains at least one translation JSON file
-        has_translations = False
-        try:
-          for file in os.listdir(item_path):
-            if file.endswith('.json') and not file.startswith('special_cases'):
-              has_translations = True
-              break
-        except (OSError, PermissionError):
-          continue
-        
-        if has_translations:
-          languages.append(item)
+    # scandir entries carry their file type, so no extra stat per entry is needed
+    with os.scandir(translations_dir) as items:
+      for item in items:
+        if item.is_dir(follow_symlinks=False):
+          # Check if folder contains at least one translation JSON file
+          try:
+            with os.scandir(item.path) as files:
+              has_translations = any(
+                file.name.endswith('.json') and not file.name.startswith('special_cases') and file.is_file(follow_symlinks=False)
+                for file in files
+              )
+          except (OSError, PermissionError):
+            continue
+          
+          if has_translations:
+            languages.append(item.name)
   
   return sorted(languages)
 
@@ -100,8 +258,8 @@ def apply_translations(lang_code, base_path):
   input_files = []
   original_version = ""
   try:
-    import xml.etree.ElementTree as ET
-    tree = ET.parse(info_xml_path)
+    # Keep the comments, the tree is written back to the output info.xml
+    tree = ET.parse(info_xml_path, parser=ET.XMLParser(target=ET.TreeBuilder(insert_comments=True)))
     root = tree.getroot()
     
     # Extract original version from root element attribute
@@ -111,13 +269,23 @@ def apply_translations(lang_code, base_path):
     else:
       print("Warning: Could not detect original version from info.xml")
     
-    # Find all <string path="..."/> elements
+    # Find all <string path="..."/> elements; each referenced folder is
+    # listed once and the files are checked against its set of names
+    existing_names = {}
     for string_element in root.find('strings').findall('string'):
       relative_path = string_element.get('path')
       if relative_path:
         # Convert relative path to absolute input path
         absolute_path = os.path.join(input_dir, relative_path)
-        if os.path.exists(absolute_path):
+        parent_dir, name = os.path.split(absolute_path)
+        if parent_dir not in existing_names:
+          try:
+            with os.scandir(parent_dir) as entries:
+              existing_names[parent_dir] = frozenset(entry.name for entry in entries)
+          except OSError:
+            existing_names[parent_dir] = frozenset()
+        # Names differing only in case still exist on case-insensitive file systems
+        if name in existing_names[parent_dir] or os.path.exists(absolute_path):
           input_files.append(absolute_path)
           print(f"  Found file: {relative_path}")
         else:
@@ -137,7 +305,6 @@ def apply_translations(lang_code, base_path):
   if os.path.exists(output_dir):
     print(f"Cleaning up old files in {output_dir}...")
     try:
-      import shutil
       shutil.rmtree(output_dir)
       print(f"Removed old output directory: {output_dir}")
     except Exception as e:
@@ -149,47 +316,14 @@ def apply_translations(lang_code, base_path):
   # Copy and update info.xml to output directory
   output_info_path = os.path.join(output_dir, "info.xml")
   try:
-    # Read original info.xml content
-    with open(info_xml_path, 'r', encoding='utf-8') as f:
-      info_content = f.read()
-    
-    # Keep original paths without modification
-    updated_content = info_content
-    
-    # Update XML attributes using regex patterns
-    import re
-    
-    # Update name attribute: add " {lang_code.upper()}(ClientENG)"
-    updated_content = re.sub(
-        r'(<resource\s+name="[^"]*)"',
-        rf'\1 {lang_code.upper()}(ClientENG)"',
-        updated_content
-    )
-    
-    # Update version attribute: add "-mod_{mod_version}"
-    updated_content = re.sub(
-      r'(<resource\s+[^>]*version=")([^"]*)"',
-      rf'\1\2-mod_{mod_version}"',
-      updated_content
-    )
-    
-    # Update author attribute: add " (edited by FlaProGmr)"
-    updated_content = re.sub(
-      r'(<resource\s+[^>]*author=")([^"]*)"',
-      r'\1\2 (edited by FlaProGmr)"',
-      updated_content
-    )
-    
-    # Update description attribute: add edited version info
-    updated_content = re.sub(
-      r'(<resource\s+[^>]*description=")([^"]*)"',
-      r'\1\2 (edited version from: https://github.com/F-l-a/Poke-translator/releases)"',
-      updated_content
-    )
+    # Update the attributes of the already parsed <resource> root
+    root.set('name', root.get('name', '') + f" {lang_code.upper()}(ClientENG)")
+    root.set('version', root.get('version', '') + f"-mod_{mod_version}")
+    root.set('author', root.get('author', '') + " (edited by FlaProGmr)")
+    root.set('description', root.get('description', '') + " (edited version from: https://github.com/F-l-a/Poke-translator/releases)")
     
     # Save updated info.xml to output
-    with open(output_info_path, 'w', encoding='utf-8') as f:
-      f.write(updated_content)
+    tree.write(output_info_path, encoding='utf-8', xml_declaration=True)
     
     print(f"Updated info.xml saved to: {output_info_path}")
     
@@ -202,8 +336,9 @@ def apply_translations(lang_code, base_path):
   if os.path.exists(icon_input_path):
     icon_output_path = os.path.join(output_dir, "icon.png")
     try:
-      import shutil
-      shutil.copy2(icon_input_path, icon_output_path)
+      # Only the content is needed: copyfile takes the kernel fast path
+      # and skips the metadata copy of copy2
+      shutil.copyfile(icon_input_path, icon_output_path)
       print(f"Copied icon.png to: {icon_output_path}")
     except Exception as e:
       print(f"Error copying icon.png: {e}")
@@ -212,6 +347,7 @@ def apply_translations(lang_code, base_path):
   
   # Process each input file
   processed_files = []  # Keep track of files that were actually processed
+  translation_plan = []  # (input file, output file, file number) translated after the prompts
   
   for input_file in input_files:
     # Calculate relative path from input directory
@@ -241,34 +377,31 @@ def apply_translations(lang_code, base_path):
       # Copy file without translation
       try:
         # Keep original filename without modification
-        import shutil
-        shutil.copy2(input_file, output_file_path)
+        shutil.copyfile(input_file, output_file_path)
         print(f"Copied without translation: {input_file} -> {output_file_path}")
         processed_files.append(relative_path)
       except Exception as e:
         print(f"Error copying file {input_file}: {e}")
     else:
-      # Translate the file (Y/YES)
-      process_single_file(input_file, lang_code, translations_dir, output_file_path, special_cases_file, len(processed_files) + 1, len(input_files))
+      # Translate the file (Y/YES) once all the choices are made
+      translation_plan.append((input_file, output_file_path, len(processed_files) + 1))
       processed_files.append(relative_path)
   
+  if translation_plan:
+    # The language files are only loaded once per run
+    bundle = load_language_bundle(lang_code, translations_dir, special_cases_file)
+    translate_files(translation_plan, bundle, len(input_files))
+  
   # Update info.xml to remove references to skipped files
   if len(processed_files) < len(input_files):
     try:
-      # Reread the updated info.xml to modify it further
-      with open(output_info_path, 'r', encoding='utf-8') as f:
-        final_info_content = f.read()
-      
-      # Remove string entries for files that were skipped
-      import xml.etree.ElementTree as ET
-      from xml.dom import minidom
-      
-      # Parse the XML
-      root = ET.fromstring(final_info_content)
+      # Reparse the updated info.xml to modify it further
+      tree = ET.parse(output_info_path)
+      root = tree.getroot()
       strings_element = root.find('strings')
       
       # Get list of processed files with original naming
-      processed_relative_paths = processed_files
+      processed_relative_paths = set(processed_files)
       
       # Remove string elements for files that weren't processed
       for string_element in strings_element.findall('string'):
@@ -277,17 +410,9 @@ def apply_translations(lang_code, base_path):
           strings_element.remove(string_element)
           print(f"Removed from info.xml: {path}")
       
-      # Save the updated info.xml with proper formatting
-      rough_string = ET.tostring(root, 'utf-8')
-      reparsed = minidom.parseString(rough_string)
-      pretty = reparsed.toprettyxml(indent="    ")
-      
-      # Remove empty lines and fix encoding declaration
-      lines = [line for line in pretty.split('\n') if line.strip()]
-      final_content = '\n'.join(lines)
-      
-      with open(output_info_path, 'w', encoding='utf-8') as f:
-        f.write(final_content)
+      # Re-indent in place and save, without a second parse for pretty-printing
+      ET.indent(tree, space="    ")
+      tree.write(output_info_path, encoding='utf-8', xml_declaration=True)
       
       print(f"Updated info.xml - removed {len(input_files) - len(processed_files)} skipped file references")
       
@@ -312,243 +437,338 @@ def apply_translations(lang_code, base_path):
   except Exception as e:
     print(f"Error creating zip_name.txt: {e}")
 
-def process_single_file(input_file, lang_code, translations_dir, output_file, special_cases_file, current_file=1, total_files=1):
+class IdRangeMap:
   """
-  Processes a single XML file with translations.
+  Maps string IDs to values where most IDs come from "start-end" ranges.
   
-  Loads the file content, applies translations using JSON dictionaries
-  and special cases, then saves the translated version to the specified output path.
+  Ranges are kept as intervals and looked up with bisect instead of being
+  expanded into one entry per ID. Like the expanded dict it replaces, an
+  entry added later wins over the earlier ones it overlaps.
+  """
+  def __init__(self):
+    self.singletons = {}  # IDs that are not plain integers
+    self._pending = []  # (start, end, value) in insertion order
+    self.ranges = []  # Disjoint (start, end, value) sorted by start
+    self._starts = []
+  
+  def add(self, id_str, value):
+    """Adds a single ID."""
+    try:
+      id_num = int(id_str)
+    except ValueError:
+      id_num = None
+    if id_num is not None and str(id_num) == id_str:
+      self._pending.append((id_num, id_num, value))
+    else:
+      self.singletons[id_str] = value
+  
+  def add_range(self, start, end, value):
+    """Adds every ID from start to end (inclusive)."""
+    if start <= end:
+      self._pending.append((start, end, value))
+  
+  def freeze(self):
+    """Resolves the added ranges into disjoint intervals, call before lookups."""
+    for start, end, value in self._pending:
+      # Cut the existing intervals around the new one, later entries win
+      position = bisect.bisect_left(self._starts, start)
+      if position and self.ranges[position - 1][1] >= start:
+        position -= 1
+      replaced = []
+      while position + len(replaced) < len(self.ranges) and self.ranges[position + len(replaced)][0] <= end:
+        replaced.append(self.ranges[position + len(replaced)])
+      kept = []
+      if replaced and replaced[0][0] < start:
+        kept.append((replaced[0][0], start - 1, replaced[0][2]))
+      kept.append((start, end, value))
+      if replaced and replaced[-1][1] > end:
+        kept.append((end + 1, replaced[-1][1], replaced[-1][2]))
+      self.ranges[position:position + len(replaced)] = kept
+      self._starts[position:position + len(replaced)] = [interval[0] for interval in kept]
+    self._pending = []
+  
+  def get(self, id_str, default=None):
+    """Returns the value of an ID, or default if no entry covers it."""
+    if id_str in self.singletons:
+      return self.singletons[id_str]
+    try:
+      id_num = int(id_str)
+    except ValueError:
+      return default
+    if str(id_num) != id_str:
+      return default
+    position = bisect.bisect_right(self._starts, id_num) - 1
+    if position >= 0 and id_num <= self.ranges[position][1]:
+      return self.ranges[position][2]
+    return default
+  
+  def __len__(self):
+    return len(self.singletons) + sum(end - start + 1 for start, end, _ in self.ranges)
+
+@dataclass(frozen=True, eq=False)
+class LanguageBundle:
+  """Translations and special cases of one language, ready to be applied."""
+  lang_code: str
+  translations: dict
+  type_translations: dict
+  move_translations: dict
+  ability_translations: dict
+  item_translations: dict
+  special_cases: IdRangeMap
+  global_add_translations: dict
+  global_no_translation_ids: IdRangeMap
+  global_no_translation_words: dict
+  global_override_translations: IdRangeMap
+  global_transform_translations: IdRangeMap
+  add_block_data: dict
+  sorted_terms: list
+  term_index: tuple
+  term_needles: list
+  whole_string_words: list
+  whole_string_re: re.Pattern | None
+  # (term, context text) -> result of _contextual_translation, filled while translating
+  contextual_memo: dict
+
+def load_language_bundle(lang_code, translations_dir, special_cases_file):
+  """
+  Loads the translation JSON files and special cases of a language and
+  indexes the terms.
+  
+  Callers load it once per run and share it by every input file; it is read
+  from disk on each call, since the generator may rewrite the language files
+  between two runs of the same session.
   
   Args:
-    input_file (str): Path to input XML file
     lang_code (str): Target language code
     translations_dir (str): Directory containing translation JSON files
-    output_file (str): Full path for the output file
     special_cases_file (str): Path to special cases JSON file
-    current_file (int): Current file number (1-based)
-    total_files (int): Total number of files being processed
-  """
-  print(f"\n{'='*50}")
-  print(f"Processing file: {input_file}")
-  print(f"{'='*50}")
-  
-  # Keep original filename without modification
-  # output_file is already set correctly by the caller
-  try:
-    with open(input_file, 'r', encoding='utf-8') as f:
-      xml_content = f.read()
     
-    print(f"XML file loaded as text ({len(xml_content)} characters)")
-    
-  except IOError as e:
-    print(f"Error reading file: {e}")
-    return
-  
+  Returns:
+    LanguageBundle: Loaded translations, special cases and term index
+  """
   # Load special cases
-  special_cases = {}
+  special_cases = IdRangeMap()
   global_add_translations = {}
-  global_no_translation_ids = set()
+  global_no_translation_ids = IdRangeMap()  # ID -> True
   global_no_translation_words = {}  # word -> {"mode": str, "exceptions": set}
-  global_override_translations = {}  # Store override translations globally
-  global_transform_translations = {}  # Store transform translations globally
+  global_override_translations = IdRangeMap()  # Store override translations globally
+  global_transform_translations = IdRangeMap()  # Store transform translations globally
   add_block_data = {}  # Initialize add_block_data
   
   if os.path.exists(special_cases_file):
     try:
-      with open(special_cases_file, 'r', encoding='utf-8') as f:
-        special_cases_data = json.load(f)
-        
-        # Handles global add_translation
-        if "add_translation" in special_cases_data:
-          global_add_translations = special_cases_data["add_translation"].get("translations", {})
-          print(f"Loaded {len(global_add_translations)} additional global translations")
-          del special_cases_data["add_translation"]
-        
-        # Save add_block to apply after translations
-        add_block_data = {}
-        if "add_block" in special_cases_data:
-          add_block_data = special_cases_data["add_block"]
-          print(f"Detected {len(add_block_data)} files for add_block (application deferred)")
-          del special_cases_data["add_block"]
+      special_cases_data = _load_json(special_cases_file)
+      
+      # Handles global add_translation
+      if "add_translation" in special_cases_data:
+        global_add_translations = special_cases_data["add_translation"].get("translations", {})
+        print(f"Loaded {len(global_add_translations)} additional global translations")
+        del special_cases_data["add_translation"]
+      
+      # Save add_block to apply after translations
+      add_block_data = {}
+      if "add_block" in special_cases_data:
+        add_block_data = special_cases_data["add_block"]
+        print(f"Detected {len(add_block_data)} files for add_block (application deferred)")
+        del special_cases_data["add_block"]
+      
+      # Handles global override_translation
+      if "override_translation" in special_cases_data:
+        override_translation_ids = special_cases_data["override_translation"].get("ids", [])
         
-        # Handles global override_translation
-        if "override_translation" in special_cases_data:
-          override_translation_ids = special_cases_data["override_translation"].get("ids", [])
+        # Process override translations
+        for id_entry in override_translation_ids:
+          # Handle structure with objects
+          id_item = id_entry.get("id", "")
+          translation = id_entry.get("translation", "")
+          reason = id_entry.get("reason", "")
           
-          # Process override translations
-          for id_entry in override_translation_ids:
-            # Handle structure with objects
-            id_item = id_entry.get("id", "")
-            translation = id_entry.get("translation", "")
-            reason = id_entry.get("reason", "")
-            
-            if "-" in id_item and id_item.replace("-", "").replace(".", "").isdigit():
-              # It's a range: "101-105" or "1000-1050"
-              try:
-                start, end = id_item.split("-")
-                start_id = int(start)
-                end_id = int(end)
-                
-                # Add all IDs in the range with the same translation
-                for id_num in range(start_id, end_id + 1):
-                  global_override_translations[str(id_num)] = {
-                    "translation": translation,
-                    "reason": reason
-                  }
-                
-                reason_info = f" ({reason})" if reason else ""
-                print(f"Expanded override_translation range {id_item} into {end_id - start_id + 1} IDs{reason_info}")
-              except ValueError:
-                print(f"Error parsing override_translation range: {id_item}")
-            else:
-              # Single ID
-              global_override_translations[id_item] = {
+          if "-" in id_item and id_item.replace("-", "").replace(".", "").isdigit():
+            # It's a range: "101-105" or "1000-1050"
+            try:
+              start, end = id_item.split("-")
+              start_id = int(start)
+              end_id = int(end)
+              
+              # Add all IDs in the range with the same translation
+              global_override_translations.add_range(start_id, end_id, {
                 "translation": translation,
                 "reason": reason
-              }
+              })
+              
               reason_info = f" ({reason})" if reason else ""
-              print(f"Added override_translation ID: {id_item}{reason_info}")
-          
-          print(f"Loaded {len(global_override_translations)} IDs for global override_translation")
-          del special_cases_data["override_translation"]
+              print(f"Expanded override_translation range {id_item} into {end_id - start_id + 1} IDs{reason_info}")
+            except ValueError:
+              print(f"Error parsing override_translation range: {id_item}")
+          else:
+            # Single ID
+            global_override_translations.add(id_item, {
+              "translation": translation,
+              "reason": reason
+            })
+            reason_info = f" ({reason})" if reason else ""
+            print(f"Added override_translation ID: {id_item}{reason_info}")
         
-        # Handles global transform_translation
-        if "transform_translation" in special_cases_data:
-          transform_translation_ids = special_cases_data["transform_translation"].get("ids", [])
-          
-          # Process transform translations
-          for id_entry in transform_translation_ids:
-            # Handle structure with objects
-            id_item = id_entry.get("id", "")
-            patterns = id_entry.get("patterns", [])
-            reason = id_entry.get("reason", "")
-            
-            if "-" in id_item and id_item.replace("-", "").replace(".", "").isdigit():
-              # It's a range: "101-105" or "1000-1050"
-              try:
-                start, end = id_item.split("-")
-                start_id = int(start)
-                end_id = int(end)
-                
-                # Add all IDs in the range with the same patterns
-                for id_num in range(start_id, end_id + 1):
-                  global_transform_translations[str(id_num)] = {
-                    "patterns": patterns,
-                    "reason": reason
-                  }
-                
-                reason_info = f" ({reason})" if reason else ""
-                print(f"Expanded transform_translation range {id_item} into {end_id - start_id + 1} IDs{reason_info}")
-              except ValueError:
-                print(f"Error parsing transform_translation range: {id_item}")
-            else:
-              # Single ID
-              global_transform_translations[id_item] = {
-                "patterns": patterns,
-                "reason": reason
-              }
-              reason_info = f" ({reason})" if reason else ""
-              print(f"Added transform_translation ID: {id_item}{reason_info}")
-          
-          print(f"Loaded {len(global_transform_translations)} IDs for global transform_translation")
-          del special_cases_data["transform_translation"]
-        # Handles global no_translation
-        if "no_translation" in special_cases_data:
-          no_translation_ids = special_cases_data["no_translation"].get("ids", [])
-          no_translation_words = special_cases_data["no_translation"].get("words", [])
+        global_override_translations.freeze()
+        print(f"Loaded {len(global_override_translations)} IDs for global override_translation")
+        del special_cases_data["override_translation"]
+      
+      # Handles global transform_translation
+      if "transform_translation" in special_cases_data:
+        transform_translation_ids = special_cases_data["transform_translation"].get("ids", [])
+        
+        # Process transform translations
+        for id_entry in transform_translation_ids:
+          # Handle structure with objects
+          id_item = id_entry.get("id", "")
+          patterns = id_entry.get("patterns", [])
+          reason = id_entry.get("reason", "")
           
-          # Expand ranges in no_translation IDs
-          for id_entry in no_translation_ids:
-            # Handle structure with objects
-            id_item = id_entry.get("id", "")
-            comment = id_entry.get("comment", "")
-            
-            if "-" in id_item and id_item.replace("-", "").replace(".", "").isdigit():
-              # It's a range: "101-105" or "1000-1050"
+          # Compile the regexes once here instead of on every matching element
+          for pattern_config in patterns:
+            if pattern_config.get("regex"):
               try:
-                start, end = id_item.split("-")
-                start_id = int(start)
-                end_id = int(end)
-                
-                # Add all IDs in the range
-                for id_num in range(start_id, end_id + 1):
-                  global_no_translation_ids.add(str(id_num))
-                
-                comment_info = f" ({comment})" if comment else ""
-                print(f"Expanded no_translation range {id_item} into {end_id - start_id + 1} IDs{comment_info}")
-              except ValueError:
-                print(f"Error parsing no_translation range: {id_item}")
-            else:
-              # Single ID
-              global_no_translation_ids.add(id_item)
-              comment_info = f" ({comment})" if comment else ""
-              print(f"Added no_translation ID: {id_item}{comment_info}")
+                pattern_config["_compiled"] = re.compile(pattern_config["regex"])
+              except re.error as e:
+                print(f"Error compiling transform_translation regex for {id_item}: {e}")
           
-          # Process no_translation words
-          for word_entry in no_translation_words:
-            word = word_entry.get("word", "")
-            mode = word_entry.get("mode", "word-only")  # Default to word-only mode
-            exceptions_list = word_entry.get("exceptions", [])  # List of ID exceptions
-            comment = word_entry.get("comment", "")
-            
-            if word:
-              # Expand ranges in exceptions
-              exceptions_set = set()
-              for exception in exceptions_list:
-                if "-" in str(exception) and str(exception).replace("-", "").replace(".", "").isdigit():
-                  # It's a range: "101-105"
-                  try:
-                    start, end = str(exception).split("-")
-                    start_id = int(start)
-                    end_id = int(end)
-                    
-                    # Add all IDs in the range
-                    for id_num in range(start_id, end_id + 1):
-                      exceptions_set.add(str(id_num))
-                  except ValueError:
-                    print(f"Error parsing exception range: {exception}")
-                else:
-                  # Single ID
-                  exceptions_set.add(str(exception))
+          if "-" in id_item and id_item.replace("-", "").replace(".", "").isdigit():
+            # It's a range: "101-105" or "1000-1050"
+            try:
+              start, end = id_item.split("-")
+              start_id = int(start)
+              end_id = int(end)
               
-              global_no_translation_words[word] = {
-                "mode": mode,
-                "exceptions": exceptions_set
-              }
+              # Add all IDs in the range with the same patterns
+              global_transform_translations.add_range(start_id, end_id, {
+                "patterns": patterns,
+                "reason": reason
+              })
               
-              comment_info = f" ({comment})" if comment else ""
-              exceptions_info = f" [exceptions: {len(exceptions_set)} IDs]" if exceptions_set else ""
-              print(f"Added no_translation word: {word} [mode: {mode}]{exceptions_info}{comment_info}")
-          
-          print(f"Loaded {len(global_no_translation_ids)} IDs for global no_translation")
-          print(f"Loaded {len(global_no_translation_words)} words for global no_translation")
-          del special_cases_data["no_translation"]
+              reason_info = f" ({reason})" if reason else ""
+              print(f"Expanded transform_translation range {id_item} into {end_id - start_id + 1} IDs{reason_info}")
+            except ValueError:
+              print(f"Error parsing transform_translation range: {id_item}")
+          else:
+            # Single ID
+            global_transform_translations.add(id_item, {
+              "patterns": patterns,
+              "reason": reason
+            })
+            reason_info = f" ({reason})" if reason else ""
+            print(f"Added transform_translation ID: {id_item}{reason_info}")
+        
+        global_transform_translations.freeze()
+        print(f"Loaded {len(global_transform_translations)} IDs for global transform_translation")
+        del special_cases_data["transform_translation"]
+      # Handles global no_translation
+      if "no_translation" in special_cases_data:
+        no_translation_ids = special_cases_data["no_translation"].get("ids", [])
+        no_translation_words = special_cases_data["no_translation"].get("words", [])
         
-        # Expand ranges in IDs
-        for key, value in special_cases_data.items():
-          if "-" in key and key.replace("-", "").replace(".", "").isdigit():
+        # Expand ranges in no_translation IDs
+        for id_entry in no_translation_ids:
+          # Handle structure with objects
+          id_item = id_entry.get("id", "")
+          comment = id_entry.get("comment", "")
+          
+          if "-" in id_item and id_item.replace("-", "").replace(".", "").isdigit():
             # It's a range: "101-105" or "1000-1050"
             try:
-              start, end = key.split("-")
+              start, end = id_item.split("-")
               start_id = int(start)
               end_id = int(end)
               
               # Add all IDs in the range
-              for id_num in range(start_id, end_id + 1):
-                special_cases[str(id_num)] = value
+              global_no_translation_ids.add_range(start_id, end_id, True)
               
-              print(f"Expanded range {key} into {end_id - start_id + 1} IDs")
+              comment_info = f" ({comment})" if comment else ""
+              print(f"Expanded no_translation range {id_item} into {end_id - start_id + 1} IDs{comment_info}")
             except ValueError:
-              print(f"Error parsing range: {key}")
+              print(f"Error parsing no_translation range: {id_item}")
           else:
             # Single ID
-            special_cases[key] = value
+            global_no_translation_ids.add(id_item, True)
+            comment_info = f" ({comment})" if comment else ""
+            print(f"Added no_translation ID: {id_item}{comment_info}")
         
-        print(f"Loaded {len(special_cases)} special cases from {special_cases_file}")
+        # Process no_translation words
+        for word_entry in no_translation_words:
+          word = word_entry.get("word", "")
+          mode = word_entry.get("mode", "word-only")  # Default to word-only mode
+          exceptions_list = word_entry.get("exceptions", [])  # List of ID exceptions
+          comment = word_entry.get("comment", "")
+          
+          if word:
+            # Expand ranges in exceptions
+            exceptions_set = set()
+            for exception in exceptions_list:
+              if "-" in str(exception) and str(exception).replace("-", "").replace(".", "").isdigit():
+                # It's a range: "101-105"
+                try:
+                  start, end = str(exception).split("-")
+                  start_id = int(start)
+                  end_id = int(end)
+                  
+                  # Add all IDs in the range
+                  for id_num in range(start_id, end_id + 1):
+                    exceptions_set.add(str(id_num))
+                except ValueError:
+                  print(f"Error parsing exception range: {exception}")
+              else:
+                # Single ID
+                exceptions_set.add(str(exception))
+            
+            global_no_translation_words[word] = {
+              "mode": mode,
+              "exceptions": frozenset(exceptions_set)
+            }
+            
+            comment_info = f" ({comment})" if comment else ""
+            exceptions_info = f" [exceptions: {len(exceptions_set)} IDs]" if exceptions_set else ""
+            print(f"Added no_translation word: {word} [mode: {mode}]{exceptions_info}{comment_info}")
+        
+        global_no_translation_ids.freeze()
+        print(f"Loaded {len(global_no_translation_ids)} IDs for global no_translation")
+        print(f"Loaded {len(global_no_translation_words)} words for global no_translation")
+        del special_cases_data["no_translation"]
+      
+      # Expand ranges in IDs
+      for key, value in special_cases_data.items():
+        # Compile the temporary translation patterns once per case, they are
+        # shared by every ID of its range
+        if isinstance(value, dict) and value.get("type") == "add_translation":
+          value["_compiled_temps"] = [
+            (re.compile(r'\b' + re.escape(english_term) + r'\b'), temp_translation)
+            for english_term, temp_translation in value.get("translations", {}).items()
+          ]
         
+        if "-" in key and key.replace("-", "").replace(".", "").isdigit():
+          # It's a range: "101-105" or "1000-1050"
+          try:
+            start, end = key.split("-")
+            start_id = int(start)
+            end_id = int(end)
+            
+            # Add all IDs in the range
+            special_cases.add_range(start_id, end_id, value)
+            
+            print(f"Expanded range {key} into {end_id - start_id + 1} IDs")
+          except ValueError:
+            print(f"Error parsing range: {key}")
+        else:
+          # Single ID
+          special_cases.add(key, value)
+      
+      special_cases.freeze()
+      print(f"Loaded {len(special_cases)} special cases from {special_cases_file}")
+      
     except (json.JSONDecodeError, IOError) as e:
       print(f"Error loading special cases: {e}")
   
+  for id_map in (special_cases, global_no_translation_ids, global_override_translations, global_transform_translations):
+    id_map.freeze()
+  
   # Load all JSON translation files for the selected language
   # Load different types of translations separately to handle context
   translations = {}
@@ -557,211 +777,325 @@ def process_single_file(input_file, lang_code, translations_dir, output_file, sp
   ability_translations = {}
   item_translations = {}
   
+  all_terms = set()  # Every English term, collected while loading
+  
+  # Category files are named "<category>-<lang>.json", everything else is generic
+  prefix_to_dict = {
+    'type': (type_translations, "types"),
+    'move': (move_translations, "moves"),
+    'ability': (ability_translations, "abilities"),
+    'item': (item_translations, "items")
+  }
+  
   if os.path.exists(translations_dir):
     # Load generic translations
-    for filename in os.listdir(translations_dir):
-      if filename.endswith('.json'):
+    with os.scandir(translations_dir) as entries:
+      for entry in entries:
+        filename = entry.name
+        if not filename.endswith('.json'):
+          continue
         try:
-          with open(os.path.join(translations_dir, filename), 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-            if filename.startswith('type-'):
-              type_translations.update(data)
-              print(f"Loaded types file: {filename} ({len(data)} translations)")
-            elif filename.startswith('move-'):
-              move_translations.update(data)
-              print(f"Loaded moves file: {filename} ({len(data)} translations)")
-            elif filename.startswith('ability-'):
-              ability_translations.update(data)
-              print(f"Loaded abilities file: {filename} ({len(data)} translations)")
-            elif filename.startswith('item-'):
-              item_translations.update(data)
-              print(f"Loaded items file: {filename} ({len(data)} translations)")
-            else:
-              translations.update(data)
-              print(f"Loaded generic file: {filename} ({len(data)} translations)")
+          # Interned keys are shared with the sorted terms built from them
+          data = {sys.intern(key): value for key, value in _load_json(entry.path).items()}
+          target, label = prefix_to_dict.get(filename.split('-', 1)[0], (translations, "generic"))
+          target.update(data)
+          all_terms.update(data)
+          print(f"Loaded {label} file: {filename} ({len(data)} translations)")
         except (json.JSONDecodeError, IOError) as e:
           print(f"Error loading {filename}: {e}")
   
   # Add global additional translations to base translations
   if global_add_translations:
     translations.update(global_add_translations)
+    all_terms.update(global_add_translations)
     print(f"Added {len(global_add_translations)} global translations to base dictionary")
   
-  if not any([translations, type_translations, move_translations, ability_translations, item_translations]):
-    print(f"No translations found for language '{lang_code}'")
-    return
-  
-  total_translations = len(translations) + len(type_translations) + len(move_translations) + len(ability_translations) + len(item_translations)
   context_specific_count = len(type_translations) + len(move_translations) + len(ability_translations) + len(item_translations)
+  total_translations = len(translations) + context_specific_count
   print(f"Loaded {total_translations} translations for '{lang_code}' (context-specific: {context_specific_count})")
   
-  def get_contextual_translation(english_term, context_text, string_id=None):
-    """
-    Decides which translation to use based on context.
-    
-    Args:
-      english_term (str): English term to translate
-      context_text (str): Context text for analysis
-      string_id (str): ID of the current string (for exceptions)
-      
-    Returns:
-      str or None: Translated term or None if no translation found
-    """
-    # HIGHEST PRIORITY: Check if the word is in no_translation words list with word-only mode
-    if english_term in global_no_translation_words:
-      word_data = global_no_translation_words[english_term]
-      if word_data["mode"] == "word-only":
-        # Check if this ID is in exceptions
-        if string_id and string_id in word_data["exceptions"]:
-          pass  # Allow translation for this ID
-        else:
-          return None  # Don't translate this word
-      # Note: whole-string mode is handled elsewhere, not here
-    
-    context_lower = context_text.lower()
-    
-    # If text is very long (>50 chars) or contains complete sentences, 
-    # it's probably a description/dialogue → don't translate technical terms like "Psychic"
-    is_description = (
-      len(context_text) > 50 or 
-      any(phrase in context_lower for phrase in [
-        'hello', 'hi ', 'thank you', 'would you like', 'do you want', 
-        'i am', 'i can', 'it is', 'the user', 'the target', 'this move',
-        'you have', 'sorry', 'congratulations', 'welcome'
-      ])
-    )
-    
-    # For descriptions, don't translate single technical terms like "Psychic"
-    if is_description and len(english_term.split()) == 1:
-      return None
-    
-    # MAX PRIORITY: Special check for parentheses - always types
-    if '(' in context_text and ')' in context_text:
-      # Extract parentheses content
-      parentheses_match = re.search(r'\(([^)]+)\)', context_text)
-      if parentheses_match and english_term == parentheses_match.group(1):
-        # It's parentheses content → always a type
-        if english_term in type_translations:
-          return type_translations.get(english_term)
-    
-    # Check first in category-specific translations
-    # 2. Check if it's an item
-    if english_term in item_translations:
-      return item_translations.get(english_term)
-    
-    # 3. Check if it's a move
-    if english_term in move_translations:
-      return move_translations.get(english_term)
-    
-    # 4. Check if it's an ability
-    if english_term in ability_translations:
-      return ability_translations.get(english_term)
-    
-    # 5. Check if it's a type with context indicators
-    type_indicators = [
-      'incense', 'plate', 'berry', 'gem', 'type', 'resistance', 'weakness',
-      'power', 'boost', 'stone', 'charm'
-    ]
-    
-    if any(indicator in context_lower for indicator in type_indicators) and english_term in type_translations:
-      return type_translations.get(english_term)
-    
-    # 6. Context indicators for moves (only for short names, not descriptions)
-    move_indicators = [
-      'learns', 'teach', 'tutor', 'tm', 'level up', 'move', 'attack', 'skill'
-    ]
-    
-    if not is_description and any(indicator in context_lower for indicator in move_indicators) and english_term in move_translations:
-      return move_translations.get(english_term)
-    
-    # 7. Context indicators for abilities
-    ability_indicators = [
-      'ability', 'abilities', 'hidden', 'effect', 'activates'
-    ]
-    
-    if any(indicator in context_lower for indicator in ability_indicators) and english_term in ability_translations:
-      return ability_translations.get(english_term)
-    
-    # 8. Fallback: generic translations for short names or complete translation
-    if len(context_text.split()) <= 3 or english_term == context_text:
-      return translations.get(english_term)
+  # Sort by decreasing length to prioritize more specific ones
+  sorted_terms = sorted(all_terms, key=len, reverse=True)
+  
+  # Index the terms by word token so each string only searches the patterns that can match it
+  term_index = _build_term_index(sorted_terms)
+  
+  # Lowered ASCII terms, which can only match a text whose lowered form
+  # contains them; None where that plain substring test isn't exact
+  term_needles = [term.lower() if term.isascii() else None for term in sorted_terms]
+  
+  # Whole-string banned words, each with its own pattern for the ID exceptions,
+  # and one alternation of all of them that rules most strings out in one search
+  banned_words = [
+    (word, word_data["exceptions"]) for word, word_data in global_no_translation_words.items()
+    if word_data["mode"] == "whole-string"
+  ]
+  whole_string_words = [
+    (re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE), exceptions)
+    for word, exceptions in banned_words
+  ]
+  whole_string_re = None
+  if banned_words:
+    whole_string_re = re.compile(r'\b(?:' + '|'.join(re.escape(word) for word, _ in banned_words) + r')\b', re.IGNORECASE)
+  
+  return LanguageBundle(
+    lang_code=lang_code,
+    translations=translations,
+    type_translations=type_translations,
+    move_translations=move_translations,
+    ability_translations=ability_translations,
+    item_translations=item_translations,
+    special_cases=special_cases,
+    global_add_translations=global_add_translations,
+    global_no_translation_ids=global_no_translation_ids,
+    global_no_translation_words=global_no_translation_words,
+    global_override_translations=global_override_translations,
+    global_transform_translations=global_transform_translations,
+    add_block_data=add_block_data,
+    sorted_terms=sorted_terms,
+    term_index=term_index,
+    term_needles=term_needles,
+    whole_string_words=whole_string_words,
+    whole_string_re=whole_string_re,
+    contextual_memo={}
+  )
+
+def get_contextual_translation(english_term, context_text, bundle, string_id=None):
+  """
+  Decides which translation to use based on context.
+  
+  Args:
+    english_term (str): English term to translate
+    context_text (str): Context text for analysis
+    bundle (LanguageBundle): Translations of the target language
+    string_id (str): ID of the current string (for exceptions)
     
+  Returns:
+    str or None: Translated term or None if no translation found
+  """
+  # HIGHEST PRIORITY: Check if the word is in no_translation words list with word-only mode
+  if english_term in bundle.global_no_translation_words:
+    word_data = bundle.global_no_translation_words[english_term]
+    if word_data["mode"] == "word-only":
+      # Check if this ID is in exceptions
+      if string_id and string_id in word_data["exceptions"]:
+        pass  # Allow translation for this ID
+      else:
+        return None  # Don't translate this word
+    # Note: whole-string mode is handled elsewhere, not here
+  
+  # Terms and context texts repeat a lot within and across the files, so the
+  # context-based part is memoized in the bundle, for as long as it is in use
+  key = (english_term, context_text)
+  translation = bundle.contextual_memo.get(key, _MISSING)
+  if translation is _MISSING:
+    translation = bundle.contextual_memo[key] = _contextual_translation(english_term, context_text, bundle)
+  return translation
+
+def _contextual_translation(english_term, context_text, bundle):
+  """
+  Context-based part of get_contextual_translation, which doesn't depend on
+  the string ID.
+  """
+  type_translations = bundle.type_translations
+  move_translations = bundle.move_translations
+  ability_translations = bundle.ability_translations
+  item_translations = bundle.item_translations
+  
+  # The context analysis only depends on the text, so it is shared by all
+  # the terms looked up for the same string
+  is_description, has_type_indicator, has_move_indicator, has_ability_indicator, is_short_text = _classify_context(context_text)
+  
+  # For descriptions, don't translate single technical terms like "Psychic"
+  if is_description and len(english_term.split()) == 1:
     return None
   
-  # Combine all translations for sorting and pre-compile patterns
-  all_terms = set()
-  all_terms.update(translations.keys())
-  all_terms.update(type_translations.keys()) 
-  all_terms.update(move_translations.keys())
-  all_terms.update(ability_translations.keys())
-  all_terms.update(item_translations.keys())
+  # MAX PRIORITY: Special check for parentheses - always types
+  if '(' in context_text and ')' in context_text:
+    # Extract parentheses content
+    parentheses_match = _PAREN_RE.search(context_text)
+    if parentheses_match and english_term == parentheses_match.group(1):
+      # It's parentheses content → always a type
+      if english_term in type_translations:
+        return type_translations.get(english_term)
   
-  # Sort by decreasing length to prioritize more specific ones
-  sorted_terms = sorted(all_terms, key=len, reverse=True)
+  # Check first in category-specific translations
+  # 2. Check if it's an item
+  if english_term in item_translations:
+    return item_translations.get(english_term)
   
-  # Pre-compile regex patterns to improve performance
-  compiled_patterns = []
-  for english_term in sorted_terms:
-    # Intelligent word boundary handling for terms with punctuation
-    escaped_term = re.escape(english_term)
-    
-    # If the term ends with punctuation, don't use word boundary at the end
-    if english_term[-1] in '.!?,:;':
-      pattern = re.compile(r'\b' + escaped_term, re.IGNORECASE)
-    # If the term starts with punctuation, don't use word boundary at the beginning  
-    elif english_term[0] in '.!?,:;':
-      pattern = re.compile(escaped_term + r'\b', re.IGNORECASE)
-    # Normal term with full word boundary
-    else:
-      pattern = re.compile(r'\b' + escaped_term + r'\b', re.IGNORECASE)
-    
-    compiled_patterns.append((pattern, english_term))
+  # 3. Check if it's a move
+  if english_term in move_translations:
+    return move_translations.get(english_term)
   
-  print(f"Processing file: {input_file} -> {output_file}")
-  print(f"Compiled regex patterns: {len(compiled_patterns)}")
+  # 4. Check if it's an ability
+  if english_term in ability_translations:
+    return ability_translations.get(english_term)
+  
+  # 5. Check if it's a type with context indicators
+  if has_type_indicator and english_term in type_translations:
+    return type_translations.get(english_term)
+  
+  # 6. Context indicators for moves (only for short names, not descriptions)
+  if not is_description and has_move_indicator and english_term in move_translations:
+    return move_translations.get(english_term)
+  
+  # 7. Context indicators for abilities
+  if has_ability_indicator and english_term in ability_translations:
+    return ability_translations.get(english_term)
+  
+  # 8. Fallback: generic translations for short names or complete translation
+  if is_short_text or english_term == context_text:
+    return bundle.translations.get(english_term)
+  
+  return None
+
+def contains_whole_string_banned_words(text, string_id, bundle):
+  """
+  Check if text contains words that should prevent translation of the entire string.
   
-  # Helper function to check if text contains whole-string banned words
-  def contains_whole_string_banned_words(text, string_id):
-    """
-    Check if text contains words that should prevent translation of the entire string.
+  Args:
+    text (str): Text to check
+    string_id (str): ID of the current string (for exceptions)
+    bundle (LanguageBundle): Translations of the target language
     
-    Args:
-      text (str): Text to check
-      string_id (str): ID of the current string (for exceptions)
-      
-    Returns:
-      bool: True if text contains whole-string banned words (without exceptions)
-    """
-    for word, word_data in global_no_translation_words.items():
-      if word_data["mode"] == "whole-string":
-        # Check if this ID is in exceptions
-        if string_id in word_data["exceptions"]:
-          continue  # Skip this word for this ID
-        
-        # Use word boundary regex to match whole words only
-        pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-        if pattern.search(text):
-          return True
+  Returns:
+    bool: True if text contains whole-string banned words (without exceptions)
+  """
+  # A single search tells whether any of the words occurs at all
+  if bundle.whole_string_re is None or not bundle.whole_string_re.search(text):
     return False
   
-  # Find all string tags with regex that includes the ID
-  string_pattern = r'(<string\s+id="([^"]+)"[^>]*>)(.*?)(</string>)'
+  for pattern, exceptions in bundle.whole_string_words:
+    # Check if this ID is in exceptions
+    if string_id in exceptions:
+      continue  # Skip this word for this ID
+    
+    # Use word boundary regex to match whole words only
+    if pattern.search(text):
+      return True
+  return False
+
+def _translate_parentheses_content(match, bundle, string_id):
+  """re.sub callback translating the content of a parentheses match as a type."""
+  content = match.group(1)
+  # Check if the word is in no_translation words list with word-only mode
+  if content in bundle.global_no_translation_words:
+    word_data = bundle.global_no_translation_words[content]
+    if word_data["mode"] == "word-only":
+      # Check if this ID is in exceptions
+      if string_id not in word_data["exceptions"]:
+        return match.group(0)  # Don't translate
+  # Parentheses ALWAYS indicate a type, so force type_translations
+  type_translations = bundle.type_translations
+  if content in type_translations:
+    return f"({type_translations[content]})"
+  return match.group(0)
+
+def _make_replacer(bundle, log, counters, current_file, total_files, total_elements):
+  """
+  Builds the replace_content function that translates one <string> match.
+  
+  Args:
+    bundle (LanguageBundle): Translations of the target language
+    log (list): Buffer receiving the per-element log lines
+    counters (dict): "translated", "not_translated" and "special_cases" totals, updated in place
+    current_file (int): Current file number (1-based)
+    total_files (int): Total number of files being processed
+    total_elements (int): Number of <string> elements in the file
+    
+  Returns:
+    function: replace_content(match, current) returning the new element text
+  """
+  # Language label of the log lines, computed once instead of per element
+  lang_label = bundle.lang_code.upper()
+  file_label = f"[File {current_file}/{total_files}]"
+  global_add_translations = bundle.global_add_translations
+  global_no_translation_words = bundle.global_no_translation_words
+  sorted_terms = bundle.sorted_terms
+  term_index = bundle.term_index
+  term_needles = bundle.term_needles
+  total_patterns = len(sorted_terms)
   
-  total_elements = len(re.findall(string_pattern, xml_content, re.DOTALL))
-  current = 0
-  translated_count = 0
-  not_translated_count = 0
-  special_cases_applied = 0
+  # Bind the per-element ID lookups once instead of resolving them on every element
+  get_override = bundle.global_override_translations.get
+  is_no_translation_id = bundle.global_no_translation_ids.get
+  get_transform = bundle.global_transform_translations.get
+  get_special_case = bundle.special_cases.get
   
-  def replace_content(match):
-    nonlocal current, translated_count, not_translated_count, special_cases_applied
+  # The normal translation of a text only depends on the string ID through
+  # the word-only exceptions, so it is memoized per text for all other IDs
+  word_exception_ids = frozenset().union(*(
+    word_data["exceptions"] for word_data in global_no_translation_words.values()
+    if word_data["mode"] == "word-only"
+  ))
+  translation_memo = {}
+  
+  def translate_text(original_text, string_id):
+    """Normal translation logic of a text, returning None when nothing is translated."""
+    translated_text = None
     
-    current += 1
-    percent = (current / total_elements) * 100
+    # First try a complete translation with context
+    contextual_translation = get_contextual_translation(original_text, original_text, bundle, string_id)
+    if contextual_translation:
+      translated_text = contextual_translation
+    else:
+      # If no complete translation is found, try partial translations
+      # Use pre-compiled patterns to improve performance
+      working_text = original_text
+      candidates = _candidate_term_indices(working_text, term_index, total_patterns)
+      # Lowered text for the substring pre-check, which isn't exact around case-folding extras
+      working_lower = None if _CASE_FOLD_EXTRAS.intersection(working_text) else working_text.lower()
+      position = 0
+      
+      while position < len(candidates):
+        term_position = candidates[position]
+        position += 1
+        # A plain substring test rules out most candidates before any regex runs
+        needle = term_needles[term_position]
+        if needle is not None and working_lower is not None and needle not in working_lower:
+          continue
+        english_term = sorted_terms[term_position]
+        # Check if the word is in no_translation words list with word-only mode
+        if english_term in global_no_translation_words:
+          word_data = global_no_translation_words[english_term]
+          if word_data["mode"] == "word-only":
+            # Check if this ID is in exceptions
+            if string_id not in word_data["exceptions"]:
+              # Skip translation for this word
+              continue
+        
+        # Only a term whose pattern matches is looked up and substituted
+        compiled_pattern = _term_pattern(english_term)
+        if not compiled_pattern.search(working_text):
+          continue
+        
+        # Use contextual translation for each term
+        context_translation = get_contextual_translation(english_term, original_text, bundle, string_id)
+        # Keys of the special cases may sit among the terms with dict values
+        if context_translation and isinstance(context_translation, str):
+          translated_working_text = compiled_pattern.sub(context_translation, working_text)
+          if translated_working_text != working_text:
+            # The substitution may bring new tokens for the remaining terms
+            working_text = translated_working_text
+            candidates = _candidate_term_indices(working_text, term_index, total_patterns, term_position)
+            working_lower = None if _CASE_FOLD_EXTRAS.intersection(working_text) else working_text.lower()
+            position = 0
+      
+      # If the text has changed, it means we made at least one partial translation
+      if working_text != original_text:
+        translated_text = working_text
     
+    # Additional check: if the translated text still contains parentheses with English types,
+    # also try to translate the parentheses content (ALWAYS as types)
+    if translated_text and '(' in translated_text and ')' in translated_text:
+      translated_text = _PAREN_RE.sub(functools.partial(_translate_parentheses_content, bundle=bundle, string_id=string_id), translated_text)
+    
+    return translated_text
+  
+  def replace_content(match, current):
     opening_tag = match.group(1)
-    string_id = match.group(2)
+    string_id = sys.intern(match.group(2))
     original_text = match.group(3).strip()
     closing_tag = match.group(4)
     
@@ -769,51 +1103,55 @@ def process_single_file(input_file, lang_code, translations_dir, output_file, sp
     if not original_text:
       return match.group(0)
     
+    # Progress prefix shared by the log lines of this element ('%' formats the
+    # same value as (current / total_elements) * 100 with '.1f')
+    progress = f"{file_label} [{current:04}/{total_elements} - {current / total_elements:.1%}]"
+    
     # ABSOLUTE PRIORITY: Check global override_translation first
-    if string_id in global_override_translations:
-      override_data = global_override_translations[string_id]
+    override_data = get_override(string_id)
+    if override_data is not None:
       translated_text = override_data.get("translation", "")
       reason = override_data.get("reason", "Global override")
       
       # Always apply override_translation, even if translation is empty
-      translated_count += 1
-      special_cases_applied += 1
-      print(f"[File {current_file}/{total_files}] [{current:04}/{total_elements} - {percent:.1f}%] - [GLOBAL_OVERRIDE] ID:{string_id} - {reason}")
-      print(f"  [EN] {original_text} = [{lang_code.upper()}] {translated_text}")
+      counters["translated"] += 1
+      counters["special_cases"] += 1
+      log.append(f"{progress} - [GLOBAL_OVERRIDE] ID:{string_id} - {reason}")
+      log.append(f"  [EN] {original_text} = [{lang_label}] {translated_text}")
       return f"{opening_tag}{translated_text}{closing_tag}"
 
     # ABSOLUTE PRIORITY: Check global no_translation
-    if string_id in global_no_translation_ids:
-      not_translated_count += 1
-      special_cases_applied += 1
-      print(f"[File {current_file}/{total_files}] [{current:04}/{total_elements} - {percent:.1f}%] - [NO_TRANSLATION] ID:{string_id} - Global category")
+    if is_no_translation_id(string_id):
+      counters["not_translated"] += 1
+      counters["special_cases"] += 1
+      log.append(f"{progress} - [NO_TRANSLATION] ID:{string_id} - Global category")
       return match.group(0)  # Returns original text without changes
 
     # HIGH PRIORITY: Check for whole-string banned words
-    if contains_whole_string_banned_words(original_text, string_id):
-      not_translated_count += 1
-      special_cases_applied += 1
-      print(f"[File {current_file}/{total_files}] [{current:04}/{total_elements} - {percent:.1f}%] - [NO_TRANSLATION_WORD] ID:{string_id} - Contains whole-string banned word")
+    if contains_whole_string_banned_words(original_text, string_id, bundle):
+      counters["not_translated"] += 1
+      counters["special_cases"] += 1
+      log.append(f"{progress} - [NO_TRANSLATION_WORD] ID:{string_id} - Contains whole-string banned word")
       return match.group(0)  # Returns original text without changes
 
     # HIGH PRIORITY: Check global transform_translation
-    if string_id in global_transform_translations:
-      transform_data = global_transform_translations[string_id]
+    transform_data = get_transform(string_id)
+    if transform_data is not None:
       patterns = transform_data.get("patterns", [])
       reason = transform_data.get("reason", "Global transform")
       
       if patterns:
-        special_cases_applied += 1
+        counters["special_cases"] += 1
         
         for pattern_config in patterns:
-          regex_pattern = pattern_config.get("regex")
+          compiled_regex = pattern_config.get("_compiled")
           template = pattern_config.get("template")
           description = pattern_config.get("description", "Transformation")
           
-          if not regex_pattern or not template:
+          if not compiled_regex or not template:
             continue
             
-          regex_match = re.search(regex_pattern, original_text)
+          regex_match = compiled_regex.search(original_text)
           if regex_match:
             # Prepare template variables
             template_vars = {
@@ -834,7 +1172,7 @@ def process_single_file(input_file, lang_code, translations_dir, output_file, sp
               translated_term = global_add_translations[main_term]
             # Then search with contextual function
             else:
-              translated_term = get_contextual_translation(main_term, original_text, string_id)
+              translated_term = get_contextual_translation(main_term, original_text, bundle, string_id)
             
             if translated_term:
               template_vars["translated"] = translated_term
@@ -844,145 +1182,242 @@ def process_single_file(input_file, lang_code, translations_dir, output_file, sp
             # Apply template
             try:
               result = template.format(**template_vars)
-              translated_count += 1
-              print(f"[File {current_file}/{total_files}] [{current:04}/{total_elements} - {percent:.1f}%] - [GLOBAL_TRANSFORM] ID:{string_id} - {description}")
-              print(f"  [EN] {original_text} = [{lang_code.upper()}] {result}")
+              counters["translated"] += 1
+              log.append(f"{progress} - [GLOBAL_TRANSFORM] ID:{string_id} - {description}")
+              log.append(f"  [EN] {original_text} = [{lang_label}] {result}")
               return f"{opening_tag}{result}{closing_tag}"
             except KeyError as e:
-              print(f"Template error for ID {string_id}: missing variable {e}")
+              log.append(f"Template error for ID {string_id}: missing variable {e}")
             
             # If the pattern matched, don't try other patterns
             break
     
     # MAXIMUM PRIORITY: Check special cases
-    if string_id in special_cases:
-      case = special_cases[string_id]
+    case = get_special_case(string_id)
+    if case is not None:
       case_type = case.get("type")
       
       if case_type == "no_translation":
-        not_translated_count += 1
-        special_cases_applied += 1
+        counters["not_translated"] += 1
+        counters["special_cases"] += 1
         reason = case.get("reason", "Special case")
-        print(f"[File {current_file}/{total_files}] [{current:04}/{total_elements} - {percent:.1f}%] - [SKIP] ID:{string_id} - {reason}")
+        log.append(f"{progress} - [SKIP] ID:{string_id} - {reason}")
         return match.group(0)  # Returns original text without changes
       
       elif case_type == "add_translation":
         # Adds temporary translations for this specific string
         temp_translations = case.get("translations", {})
         if temp_translations:
-          special_cases_applied += 1
+          counters["special_cases"] += 1
           # Use temporary translations together with normal ones
           working_text = original_text
           
           # First apply temporary translations (priority)
-          for english_term, temp_translation in temp_translations.items():
-            pattern_temp = re.compile(r'\b' + re.escape(english_term) + r'\b')
-            if pattern_temp.search(working_text):
-              working_text = pattern_temp.sub(temp_translation, working_text)
+          for pattern_temp, temp_translation in case["_compiled_temps"]:
+            working_text = pattern_temp.sub(temp_translation, working_text)
           
           # If at least one temporary translation was applied
           if working_text != original_text:
-            translated_count += 1
+            counters["translated"] += 1
             reason = case.get("reason", "Added translation")
-            print(f"[File {current_file}/{total_files}] [{current:04}/{total_elements} - {percent:.1f}%] - [ADD_TRANS] ID:{string_id} - {reason}")
-            print(f"  [EN] {original_text} = [{lang_code.upper()}] {working_text}")
+            log.append(f"{progress} - [ADD_TRANS] ID:{string_id} - {reason}")
+            log.append(f"  [EN] {original_text} = [{lang_label}] {working_text}")
             return f"{opening_tag}{working_text}{closing_tag}"
           # If no temporary translation was applied, continue with normal logic
     
     # Normal translation logic (only if not handled by special cases)
-    translated_text = None
-    
-    # First try a complete translation with context
-    contextual_translation = get_contextual_translation(original_text, original_text, string_id)
-    if contextual_translation:
-      translated_text = contextual_translation
+    if string_id in word_exception_ids:
+      translated_text = translate_text(original_text, string_id)
     else:
-      # If no complete translation is found, try partial translations
-      # Use pre-compiled patterns to improve performance
-      working_text = original_text
-      
-      for compiled_pattern, english_term in compiled_patterns:
-        if compiled_pattern.search(working_text):
-          # Check if the word is in no_translation words list with word-only mode
-          if english_term in global_no_translation_words:
-            word_data = global_no_translation_words[english_term]
-            if word_data["mode"] == "word-only":
-              # Check if this ID is in exceptions
-              if string_id not in word_data["exceptions"]:
-                # Skip translation for this word
-                continue
-          
-          # Use contextual translation for each term
-          context_translation = get_contextual_translation(english_term, original_text, string_id)
-          if context_translation:
-            working_text = compiled_pattern.sub(context_translation, working_text)
-      
-      # If the text has changed, it means we made at least one partial translation
-      if working_text != original_text:
-        translated_text = working_text
-    
-    # Additional check: if the translated text still contains parentheses with English types,
-    # also try to translate the parentheses content (ALWAYS as types)
-    if translated_text and '(' in translated_text and ')' in translated_text:
-      def translate_parentheses_content(match):
-        content = match.group(1)
-        # Check if the word is in no_translation words list with word-only mode
-        if content in global_no_translation_words:
-          word_data = global_no_translation_words[content]
-          if word_data["mode"] == "word-only":
-            # Check if this ID is in exceptions
-            if string_id not in word_data["exceptions"]:
-              return match.group(0)  # Don't translate
-        # Parentheses ALWAYS indicate a type, so force type_translations
-        if content in type_translations:
-          return f"({type_translations[content]})"
-        return match.group(0)
-      
-      translated_text = re.sub(r'\(([^)]+)\)', translate_parentheses_content, translated_text)
+      translated_text = translation_memo.get(original_text, _MISSING)
+      if translated_text is _MISSING:
+        translated_text = translation_memo[original_text] = translate_text(original_text, string_id)
     
     if translated_text:
-      translated_count += 1
-      status = f"[EN] {original_text} = [{lang_code.upper()}] {translated_text}"
-      print(f"[File {current_file}/{total_files}] [{current:04}/{total_elements} - {percent:.1f}%] - {status}")
+      counters["translated"] += 1
+      status = f"[EN] {original_text} = [{lang_label}] {translated_text}"
+      log.append(f"{progress} - {status}")
       return f"{opening_tag}{translated_text}{closing_tag}"
     else:
-      not_translated_count += 1
+      counters["not_translated"] += 1
       status = f"[EN] {original_text} = [NO TRANSLATION]"
-      print(f"[File {current_file}/{total_files}] [{current:04}/{total_elements} - {percent:.1f}%] - {status}")
+      log.append(f"{progress} - {status}")
       return match.group(0)
   
-  # Apply translations using re.sub with a function
-  xml_content = re.sub(string_pattern, replace_content, xml_content, flags=re.DOTALL)
+  return replace_content
+
+def _read_text(path):
+  """
+  Reads a UTF-8 file with a single read and decode, translating its line
+  endings to '\n' like text mode does.
+  
+  Returns:
+    tuple: (text, newlines) where newlines is what a text-mode file reports
+           in its newlines attribute: None, one line ending or a tuple of them
+  """
+  text = Path(path).read_bytes().decode('utf-8')
+  if '\r' not in text:
+    return text, ('\n' if '\n' in text else None)
+  crlf_count = text.count('\r\n')
+  found = tuple(newline for newline, count in (
+    ('\r', text.count('\r') - crlf_count),
+    ('\n', text.count('\n') - crlf_count),
+    ('\r\n', crlf_count)
+  ) if count)
+  text = text.replace('\r\n', '\n').replace('\r', '\n')
+  return text, found[0] if len(found) == 1 else found
+
+# Bundle of the worker processes of translate_files, set by _init_translation_worker
+_worker_bundle = None
+
+def _init_translation_worker(bundle):
+  """Stores the bundle sent once to each worker process."""
+  global _worker_bundle
+  _worker_bundle = bundle
+
+def _translate_in_worker(input_file, output_file, current_file, total_files):
+  """Translates one file in a worker process with the bundle it received."""
+  process_single_file(input_file, _worker_bundle, output_file, current_file, total_files)
+  sys.stdout.flush()
+
+def translate_files(translation_plan, bundle, total_files):
+  """
+  Translates several files, in parallel worker processes when there is more than one.
+  
+  The files are independent and the translation is CPU-bound, so each file
+  gets its own process; the bundle is pickled once per worker, not per file.
+  
+  Args:
+    translation_plan (list): (input file, output file, file number) tuples
+    bundle (LanguageBundle): Translations of the target language
+    total_files (int): Total number of files being processed
+  """
+  if len(translation_plan) == 1:
+    input_file, output_file, current_file = translation_plan[0]
+    process_single_file(input_file, bundle, output_file, current_file, total_files)
+    return
+  
+  # Flush before forking so the workers don't repeat buffered output
+  sys.stdout.flush()
+  max_workers = min(len(translation_plan), os.cpu_count() or 1)
+  with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_translation_worker, initargs=(bundle,)) as executor:
+    futures = [
+      executor.submit(_translate_in_worker, input_file, output_file, current_file, total_files)
+      for input_file, output_file, current_file in translation_plan
+    ]
+    for future in futures:
+      future.result()
+
+def process_single_file(input_file, bundle, output_file, current_file=1, total_files=1):
+  """
+  Processes a single XML file with translations.
+  
+  Loads the file content, applies translations using JSON dictionaries
+  and special cases, then saves the translated version to the specified output path.
+  
+  Args:
+    input_file (str): Path to input XML file
+    bundle (LanguageBundle): Translations of the target language, see load_language_bundle
+    output_file (str): Full path for the output file
+    current_file (int): Current file number (1-based)
+    total_files (int): Total number of files being processed
+  """
+  print(f"\n{'='*50}")
+  print(f"Processing file: {input_file}")
+  print(f"{'='*50}")
   
-  # Apply add_block AFTER translations (to not translate added content)
+  # Keep original filename without modification
+  # output_file is already set correctly by the caller
+  try:
+    xml_content, input_newlines = _read_text(input_file)
+    
+    print(f"XML file loaded as text ({len(xml_content)} characters)")
+    
+  except IOError as e:
+    print(f"Error reading file: {e}")
+    return
+  
+  if not bundle.sorted_terms:
+    print(f"No translations found for language '{bundle.lang_code}'")
+    return
+  
+  add_block_data = bundle.add_block_data
+  
+  print(f"Processing file: {input_file} -> {output_file}")
+  print(f"Indexed terms: {len(bundle.sorted_terms)}")
+  
+  # Find all string tags with regex that includes the ID, in a single scan
+  # whose matches are reused below to rebuild the content
+  string_matches = list(_STRING_RE.finditer(xml_content))
+  
+  total_elements = len(string_matches)
+  counters = {"translated": 0, "not_translated": 0, "special_cases": 0}
+  log = []  # Per-element log lines, written in batches
+  replace_content = _make_replacer(bundle, log, counters, current_file, total_files, total_elements)
+  
+  # Apply translations by stitching the untouched text between the matches
+  # with their replacements (same result as re.sub, without a second scan)
+  parts = []
+  last_end = 0
+  for current, match in enumerate(string_matches, 1):
+    # Empty elements are left inside the untouched text without a call to replace_content
+    if not match.group(3).strip():
+      continue
+    replacement = replace_content(match, current)
+    # Unchanged elements also stay inside the untouched text
+    if replacement != match.group(0):
+      parts.append(xml_content[last_end:match.start()])
+      parts.append(replacement)
+      last_end = match.end()
+    if len(log) >= _LOG_FLUSH_LINES:
+      _flush_log(log)
+  _flush_log(log)
+  changed = bool(parts)
+  parts.append(xml_content[last_end:])
+  
+  # Apply add_block AFTER translations (to not translate added content); it is
+  # spliced into the parts, which are written out without joining them
   if add_block_data:
-    for file_path, block_info in add_block_data.items():
-      # Normalize paths for comparison (convert separators and compare relative paths)
-      normalized_input = input_file.replace("\\", "/")
-      if file_path == normalized_input:  # Compare normalized paths
-        content_to_add = block_info.get("content", "")
-        reason = block_info.get("reason", "Block addition")
-        
-        if content_to_add:
-          # Find the last closing tag (presumably the main container)
-          last_close_tag_pos = xml_content.rfind("</" )
+    # Normalize paths for comparison (convert separators and compare relative paths)
+    normalized_input = input_file.replace("\\", "/")
+    block_info = add_block_data.get(normalized_input)
+    if block_info is not None:
+      content_to_add = block_info.get("content", "")
+      reason = block_info.get("reason", "Block addition")
+      
+      if content_to_add:
+        # Find the last closing tag (presumably the main container), from the last part backwards
+        for part_index in range(len(parts) - 1, -1, -1):
+          part = parts[part_index]
+          last_close_tag_pos = part.rfind("</")
           if last_close_tag_pos != -1:
             # Insert content before the last closing tag
-            xml_content = (xml_content[:last_close_tag_pos] + content_to_add + "\n" + xml_content[last_close_tag_pos:])
-            print(f"Added block to file {file_path}: {reason}")
+            parts[part_index:part_index + 1] = [part[:last_close_tag_pos], content_to_add, "\n", part[last_close_tag_pos:]]
+            changed = True
+            print(f"Added block to file {normalized_input}: {reason}")
             print(f"Content added: {len(content_to_add)} characters")
-          else:
-            print(f"Error: closing tag not found to add block in {file_path}")
+            break
+        else:
+          print(f"Error: closing tag not found to add block in {normalized_input}")
   
   # Save translated XML
   try:
-    # Save the modified XML content
-    with open(output_file, 'w', encoding='utf-8') as f:
-      f.write(xml_content)
+    if not changed and (input_newlines is None or input_newlines == os.linesep):
+      # Nothing was translated and writing the text back would reproduce the
+      # input bytes exactly, so copy the file instead
+      shutil.copyfile(input_file, output_file)
+    else:
+      # Save the modified XML content: the parts are encoded one by one (with
+      # the same newline translation text mode would do) into a large buffer,
+      # so the whole document is never held as one more str and bytes copy
+      if os.linesep != '\n':
+        parts = [part.replace('\n', os.linesep) for part in parts]
+      with open(output_file, 'wb', buffering=_WRITE_BUFSIZE) as f:
+        f.writelines(part.encode('utf-8') for part in parts)
     
     print(f"\nProcessing completed!")
-    print(f"Translated elements: {translated_count}/{total_elements}. Non-translated elements: {not_translated_count}/{total_elements}")
-    print(f"Special cases applied: {special_cases_applied}")
+    print(f"Translated elements: {counters['translated']}/{total_elements}. Non-translated elements: {counters['not_translated']}/{total_elements}")
+    print(f"Special cases applied: {counters['special_cases']}")
     print(f"File saved: {output_file}")
   except IOError as e:
     print(f"Error saving file: {e}")
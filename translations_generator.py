@@ -3,8 +3,15 @@ import json
 import time
 import os
 import csv
+import io
+import functools
 from utils import print_menu, get_user_choice, get_available_languages
 
+@functools.lru_cache(maxsize=None)
+def _get_language_id(lang_code: str) -> int:
+  """Returns the PokeAPI id of a language, looked up once per run."""
+  return pb.APIResource('language', lang_code).id
+
 def get_client_dump_languages() -> list:
   """
   Returns a list of available languages based on folder names in the
@@ -190,8 +197,7 @@ def get_translations(endpoint: str, lang_code: str, base_path: str) -> dict:
 
   # Get target language ID once for efficiency
   try:
-    lang_resource = pb.APIResource('language', lang_code)
-    lang_id = lang_resource.id
+    lang_id = _get_language_id(lang_code)
   except Exception as e:
     print(f"Error retrieving language ID for '{lang_code}': {e}")
     lang_id = None
@@ -264,15 +270,19 @@ def save_missing_translations_csv(missing_translations: list, endpoint: str, lan
   # Check if file exists to add header only if necessary
   file_exists = os.path.isfile(filename)
   
+  # Format all rows in memory and append them with a single write
+  buffer = io.StringIO(newline='')
+  writer = csv.writer(buffer)
+  
+  # Write header only if file is new
+  if not file_exists:
+    writer.writerow(['resource_id', 'language_id', 'english_name', 'translation'])
+  
+  # Write all missing translations
+  writer.writerows(missing_translations)
+
   with open(filename, "a", encoding="utf-8", newline='') as csvfile:
-    writer = csv.writer(csvfile)
-    
-    # Write header only if file is new
-    if not file_exists:
-      writer.writerow(['resource_id', 'language_id', 'english_name', 'translation'])
-    
-    # Write all missing translations
-    writer.writerows(missing_translations)
+    csvfile.write(buffer.getvalue())
 
 def save_json(data: dict, endpoint: str, lang_code: str, base_path: str):
   """
@@ -289,5 +299,7 @@ def save_json(data: dict, endpoint: str, lang_code: str, base_path: str):
   directory = f"{base_path}/{lang_code}"
   filename = f"{directory}/{endpoint}-{lang_code}.json"
   os.makedirs(directory, exist_ok=True)
+  # Serialize once and hand the whole document to a single write
+  payload = json.dumps(data, ensure_ascii=False, indent=2)
   with open(filename, "w", encoding="utf-8") as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+    f.write(payload)
\ No newline at end of file
@@ -1,3 +1,4 @@
+import functools
 import pokebase as pb
 
 def print_menu(options: list, title: str):
@@ -38,11 +39,16 @@ def get_available_languages() -> list:
   """
   Returns a list of available language codes from PokeAPI.
   
-  Fetches all supported languages from the PokeAPI language endpoint.
+  Fetches all supported languages from the PokeAPI language endpoint, once
+  per run: going back to the menu reuses the first answer.
   
   Returns:
     list: List of language codes (e.g., ['en', 'it', 'fr', 'es'])
   """
+  return list(_fetch_language_names())
+
+@functools.lru_cache(maxsize=1)
+def _fetch_language_names() -> tuple:
+  """Fetches the language codes from PokeAPI; a tuple so the cached value can't be modified."""
   response = pb.APIResourceList("language")  # List of dict with 'name'
-  lang_list = [lang['name'] for lang in response]
-  return lang_list
\ No newline at end of file
+  return tuple(lang['name'] for lang in response)